@@ -1,8 +1,17 @@
-from flask import Flask, render_template, request, jsonify
-import math
+from flask import Flask, Response, render_template, request, stream_with_context
+import functools
+import orjson
+
+from epf_core import calculate_epf_balance, paise, parts_per_million
 
 app = Flask(__name__)
 
+# Longest projection the API will compute; cached results grow with the horizon
+MAX_YEARS_TO_RETIREMENT = 100
+
+# Largest monthly salary the API accepts (₹1 crore)
+MAX_MONTHLY_SALARY = 10_000_000
+
 @app.route('/')
 def home():
     return render_template('index.html')
@@ -15,53 +24,108 @@ def epf_calculator():
 def about():
     return render_template('about.html')
 
-def calculate_epf_balance(monthly_salary, current_age, retirement_age, 
-                         epf_contribution_rate, annual_increase, interest_rate):
+def _json_response(payload, status=200):
     """
-    Calculate EPF maturity amount using the exact formula logic specified
+    Serialize payload with orjson, which writes NumPy arrays natively
+    """
+    return Response(
+        orjson.dumps(payload, option=orjson.OPT_SERIALIZE_NUMPY),
+        status=status,
+        mimetype='application/json'
+    )
+
+def _epf_payload(result):
+    """
+    Shape a calculate_epf_balance result into the /calculate-epf response
     """
-    years_to_retirement = retirement_age - current_age
-    yearly_data = []
-    
-    # Initialize tracking variables
-    current_monthly_salary = monthly_salary
-    epf_balance = 0.0
-    total_contribution = 0.0
-    total_interest = 0.0
-    
-    # Main calculation loop
-    for year in range(1, years_to_retirement + 1):
-        # Calculate yearly EPF contribution
-        yearly_contribution = current_monthly_salary * 12 * epf_contribution_rate
-        
-        # Calculate interest on existing balance (compound interest)
-        interest_earned = epf_balance * interest_rate
-        
-        # Update EPF balance
-        epf_balance = epf_balance + yearly_contribution + interest_earned
-        
-        # Update totals
-        total_contribution += yearly_contribution
-        total_interest += interest_earned
-        
-        # Store yearly data
-        yearly_data.append({
-            'year': current_age + year,
-            'annual_contribution': round(yearly_contribution, 2),
-            'interest_earned': round(interest_earned, 2),
-            'epf_balance': round(epf_balance, 2)
-        })
-        
-        # Increase salary for next year
-        current_monthly_salary = current_monthly_salary * (1 + annual_increase)
-    
     return {
-        'total_contribution': round(total_contribution, 2),
-        'interest_earned': round(total_interest, 2),
-        'final_balance': round(epf_balance, 2),
-        'yearly_data': yearly_data
+        'success': True,
+        'final_amount': result['final_balance'],
+        'total_contribution': result['total_contribution'],
+        'total_interest': result['interest_earned'],
+        'yearly_data': result['yearly_data']
     }
 
+def _input_key(monthly_salary, current_age, retirement_age,
+               epf_contribution_rate, annual_increase, interest_rate):
+    """
+    Quantized lookup key for a set of calculator inputs
+    """
+    return (paise(monthly_salary), current_age, retirement_age,
+            parts_per_million(epf_contribution_rate),
+            parts_per_million(annual_increase),
+            parts_per_million(interest_rate))
+
+# Frequently submitted inputs (salary, current age, retirement age, EPF
+# contribution, salary increase, interest rate): the calculator defaults and
+# the ₹15,000 statutory wage ceiling at retirement ages 58 and 60
+CANONICAL_INPUTS = [
+    (50000.0, 30, 60, 0.24, 0.05, 0.0825),
+    (15000.0, 30, 58, 0.24, 0.05, 0.0825),
+    (15000.0, 30, 60, 0.24, 0.05, 0.0825),
+]
+
+def _serialize(payload):
+    """
+    Serialize a response payload to its JSON body
+    """
+    return orjson.dumps(payload, option=orjson.OPT_SERIALIZE_NUMPY)
+
+def _calculate_for_key(key, detailed):
+    """
+    Run calculate_epf_balance on a quantized input key
+    """
+    (salary_paise, current_age, retirement_age,
+     contribution_ppm, increase_ppm, interest_ppm) = key
+    return calculate_epf_balance(
+        monthly_salary=salary_paise / 100,
+        current_age=current_age,
+        retirement_age=retirement_age,
+        epf_contribution_rate=contribution_ppm / 1_000_000,
+        annual_increase=increase_ppm / 1_000_000,
+        interest_rate=interest_ppm / 1_000_000,
+        detailed=detailed
+    )
+
+@functools.lru_cache(maxsize=4096)
+def _cached_json(key, detailed):
+    """
+    Serialized /calculate-epf response for a quantized input key
+    """
+    return _serialize(_epf_payload(_calculate_for_key(key, detailed)))
+
+def _cached_response(body):
+    """
+    Response for a pre-serialized JSON body
+    """
+    return Response(body, mimetype='application/json')
+
+def _ndjson_lines(result):
+    """
+    Yield a calculate_epf_balance result as NDJSON: a summary line followed
+    by one line per year, read from the yearly_data columns
+    """
+    option = orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_APPEND_NEWLINE
+    
+    yield orjson.dumps({
+        'success': True,
+        'final_amount': result['final_balance'],
+        'total_contribution': result['total_contribution'],
+        'total_interest': result['interest_earned']
+    }, option=option)
+    
+    yearly_data = result['yearly_data']
+    fields = list(yearly_data)
+    for values in zip(*yearly_data.values()):
+        yield orjson.dumps(dict(zip(fields, values)), option=option)
+
+# Responses for the canonical inputs are serialized once at import, which
+# also warms up the compiled helpers before the first request
+CANONICAL_RESPONSES = {
+    _input_key(*inputs): _serialize(_epf_payload(calculate_epf_balance(*inputs)))
+    for inputs in CANONICAL_INPUTS
+}
+
 @app.route('/calculate-epf', methods=['POST'])
 def calculate_epf():
     try:
@@ -74,29 +138,55 @@ def calculate_epf():
         interest_rate = float(data['interest_rate']) / 100
         retirement_age = int(data['retirement_age'])
         
-        # Use the improved calculation function
-        result = calculate_epf_balance(
-            monthly_salary=monthly_salary,
-            current_age=current_age,
-            retirement_age=retirement_age,
-            epf_contribution_rate=epf_contribution_rate,
-            annual_increase=annual_increase,
-            interest_rate=interest_rate
+        if retirement_age - current_age > MAX_YEARS_TO_RETIREMENT:
+            raise ValueError(
+                f'Retirement age must be within {MAX_YEARS_TO_RETIREMENT} years of current age'
+            )
+        
+        # Range checks are written so that NaN fails them too
+        if not 0 <= monthly_salary <= MAX_MONTHLY_SALARY:
+            raise ValueError(
+                f'Monthly salary must be between 0 and {MAX_MONTHLY_SALARY:,}'
+            )
+        if not 0 <= epf_contribution_rate <= 1:
+            raise ValueError('EPF contribution rate must be between 0% and 100%')
+        if not (-1 <= annual_increase <= 1 and -1 <= interest_rate <= 1):
+            raise ValueError(
+                'Annual increase and interest rate must be between -100% and 100%'
+            )
+        
+        # ?summary=1 skips the year-wise breakdown
+        summary_only = request.args.get('summary') == '1'
+        
+        key = _input_key(
+            monthly_salary, current_age, retirement_age,
+            epf_contribution_rate, annual_increase, interest_rate
         )
         
-        return jsonify({
-            'success': True,
-            'final_amount': result['final_balance'],
-            'total_contribution': result['total_contribution'],
-            'total_interest': result['interest_earned'],
-            'yearly_data': result['yearly_data']
-        })
+        # ?stream=1 writes NDJSON line by line for long horizons
+        if request.args.get('stream') == '1':
+            result = _calculate_for_key(key, detailed=not summary_only)
+            return Response(
+                stream_with_context(_ndjson_lines(result)),
+                mimetype='application/x-ndjson'
+            )
+        
+        cached = None if summary_only else CANONICAL_RESPONSES.get(key)
+        if cached is None:
+            cached = _cached_json(key, detailed=not summary_only)
         
+        return _cached_response(cached)
+        
+    except OverflowError:
+        return _json_response({
+            'success': False,
+            'error': 'Projected amounts are too large to calculate'
+        }, status=400)
     except Exception as e:
-        return jsonify({
+        return _json_response({
             'success': False,
             'error': str(e)
-        }), 400
+        }, status=400)
 
 # For Vercel deployment
 app.debug = False
@@ -0,0 +1,258 @@
+"""
+EPF (Employees' Provident Fund) projection core
+
+Year-by-year projection of EPF contributions, compound interest and balance,
+shared by the Flask app (app.py) and the command-line calculator (epf_cli.py):
+- Salary grows by the annual increase rate each year
+- Yearly contribution = monthly_salary × 12 × epf_contribution_rate
+- Interest is earned on the previous year's closing balance
+"""
+
+import functools
+import math
+import os
+import tempfile
+
+# Numba's cache=True writes next to this file; read-only deployments such as
+# Vercel fall back to the temp directory. Must be set before numba is imported.
+if not os.access(os.path.dirname(os.path.abspath(__file__)), os.W_OK):
+    os.environ.setdefault('NUMBA_CACHE_DIR', os.path.join(tempfile.gettempdir(), 'numba_cache'))
+
+import numba
+import numpy as np
+
+_INT64_MAX = np.iinfo(np.int64).max
+_INT64_MIN = np.iinfo(np.int64).min
+
+@numba.njit('int64(int64, int64)', cache=True, nogil=True)
+def _apply_ppm(amount, ppm):
+    """
+    amount × ppm / 1,000,000 in integer arithmetic, rounded half away from zero
+    """
+    # abs() of INT64_MIN wraps, and the rounding below adds up to 500,000
+    if amount == _INT64_MIN or ppm == _INT64_MIN:
+        raise OverflowError('amount too large for paise arithmetic')
+    if ppm != 0 and abs(amount) > (_INT64_MAX - 500_000) // abs(ppm):
+        raise OverflowError('amount too large for paise arithmetic')
+    product = amount * ppm
+    rounded = (abs(product) + 500_000) // 1_000_000
+    return rounded if product >= 0 else -rounded
+
+@numba.njit('int64(int64, int64)', cache=True, nogil=True)
+def _add(a, b):
+    """
+    a + b in integer arithmetic, raising instead of wrapping around
+    """
+    if (b > 0 and a > _INT64_MAX - b) or (b < 0 and a < _INT64_MIN - b):
+        raise OverflowError('amount too large for paise arithmetic')
+    return a + b
+
+@numba.njit('(int64, int64, int64[:])', cache=True, nogil=True)
+def _salaries(salary_paise, increase_ppm, salaries):
+    """
+    Fill salaries (paise) year by year, compounding by running multiplication
+    """
+    growth_ppm = 1_000_000 + increase_ppm
+    
+    current_monthly_salary = salary_paise
+    for year in range(salaries.shape[0]):
+        salaries[year] = current_monthly_salary
+        current_monthly_salary = _apply_ppm(current_monthly_salary, growth_ppm)
+
+@numba.njit('int64(int64[:], int64, int64[:])', cache=True, nogil=True)
+def _contributions(salaries, contribution_ppm, contributions):
+    """
+    Fill contributions with the yearly EPF contribution (paise) for each
+    salary and return their total
+    """
+    yearly_ppm = 12 * contribution_ppm
+    total_contribution = 0
+    for year in range(salaries.shape[0]):
+        contributions[year] = _apply_ppm(salaries[year], yearly_ppm)
+        total_contribution = _add(total_contribution, contributions[year])
+    
+    return total_contribution
+
+@numba.njit('int64(int64[:], int64, int64[:], int64[:])', cache=True, nogil=True)
+def _epf_core(contributions, interest_ppm, interest, balances):
+    """
+    Compound the yearly contributions into the EPF balance, compiled to
+    native code by Numba
+    
+    All amounts are integer paise. Fills the preallocated interest and
+    balances arrays and returns the total interest
+    """
+    epf_balance = 0
+    total_interest = 0
+    
+    for year in range(contributions.shape[0]):
+        # Calculate interest on existing balance (compound interest)
+        interest_earned = _apply_ppm(epf_balance, interest_ppm)
+        
+        # Update EPF balance and total interest
+        epf_balance = _add(_add(epf_balance, contributions[year]), interest_earned)
+        total_interest = _add(total_interest, interest_earned)
+        
+        interest[year] = interest_earned
+        balances[year] = epf_balance
+    
+    return total_interest
+
+def paise(amount):
+    """
+    Rupee amount as an integer number of paise
+    """
+    return round(amount * 100)
+
+def parts_per_million(rate):
+    """
+    Decimal rate as an integer number of parts per million (0.0001%)
+    """
+    return round(rate * 1_000_000)
+
+@functools.lru_cache(maxsize=1024)
+def _projection(salary_paise, years, contribution_ppm, increase_ppm, interest_ppm):
+    """
+    Cached year-wise projection keyed on integer paise and rates in parts
+    per million
+    
+    The projection runs in integer paise, so amounts are exact to the paisa
+    and need no rounding. Returns the monthly salary, contribution, interest
+    and balance arrays in rupees (read-only, since they are shared between
+    callers) and the totals
+    """
+    # One allocation holds every output column
+    columns = np.empty((4, years), dtype=np.int64)
+    salaries, contributions, interest, balances = columns
+    
+    _salaries(salary_paise, increase_ppm, salaries)
+    total_contribution = _contributions(salaries, contribution_ppm, contributions)
+    total_interest = _epf_core(contributions, interest_ppm, interest, balances)
+    
+    # Paise to rupees in a single pass; the rows stay NumPy arrays and are
+    # serialized directly by orjson
+    rupees = columns / 100
+    rupees.flags.writeable = False
+    
+    monthly_salaries, annual_contribution, interest_earned, epf_balances = rupees
+    return (monthly_salaries, annual_contribution, interest_earned, epf_balances,
+            total_contribution / 100, total_interest / 100)
+
+def calculate_epf_balance(monthly_salary=50000, current_age=30, retirement_age=60,
+                          epf_contribution_rate=0.24, annual_increase=0.05,
+                          interest_rate=0.0825, detailed=True):
+    """
+    Calculate EPF maturity amount using compound interest formula.
+    
+    Inputs:
+        monthly_salary (float): Monthly salary in rupees (default: 50000)
+        current_age (int): Current age in years (default: 30)
+        retirement_age (int): Retirement age in years (default: 60)
+        epf_contribution_rate (float): EPF contribution rate as decimal (default: 0.24 = 24%)
+        annual_increase (float): Annual salary increase rate as decimal (default: 0.05 = 5%)
+        interest_rate (float): Annual interest rate as decimal (default: 0.0825 = 8.25%)
+        detailed (bool): Compute the year-wise breakdown (default: True)
+    
+    Returns:
+        dict: {
+            'total_contribution': Total amount contributed over the years,
+            'interest_earned': Total interest earned through compound interest,
+            'final_balance': Total EPF balance at retirement,
+            'yearly_data': Year-wise columns (year, monthly_salary,
+                           annual_contribution, interest_earned, epf_balance)
+        }
+    
+    With detailed=False only the totals are computed, in constant time via
+    the growing-annuity formula, and the yearly_data columns are left empty.
+    The detailed projection quantizes the salary to paise and the rates to
+    parts per million (0.0001%), computes in integer paise and is served from
+    an LRU cache
+    """
+    years_to_retirement = max(retirement_age - current_age, 0)
+    
+    if not detailed:
+        first_contribution = monthly_salary * 12 * epf_contribution_rate
+        
+        # The log1p/expm1 forms below need positive growth factors; at or
+        # below -100% fall back to plain integer powers
+        stable = annual_increase > -1 and interest_rate > -1
+        
+        # B_N = C * ((1 + i)^N - (1 + g)^N) / (i - g), rewritten as
+        # C * (1 + g)^N * expm1(N * log1p((i - g) / (1 + g))) / (i - g) so that
+        # close rates do not cancel catastrophically; i == g takes the limit
+        rate_gap = interest_rate - annual_increase
+        if rate_gap == 0:
+            epf_balance = (first_contribution * years_to_retirement
+                           * math.pow(1 + annual_increase,
+                                      max(years_to_retirement - 1, 0)))
+        elif stable:
+            relative_growth = math.expm1(
+                years_to_retirement * math.log1p(rate_gap / (1 + annual_increase))
+            )
+            epf_balance = (first_contribution
+                           * math.exp(years_to_retirement * math.log1p(annual_increase))
+                           * relative_growth / rate_gap)
+        else:
+            epf_balance = (first_contribution
+                           * (math.pow(1 + interest_rate, years_to_retirement)
+                              - math.pow(1 + annual_increase, years_to_retirement))
+                           / rate_gap)
+        
+        # Sum of the geometric contribution series, C * ((1 + g)^N - 1) / g
+        if annual_increase == 0:
+            total_contribution = first_contribution * years_to_retirement
+        elif annual_increase > -1:
+            total_contribution = (first_contribution
+                                  * math.expm1(years_to_retirement
+                                               * math.log1p(annual_increase))
+                                  / annual_increase)
+        else:
+            total_contribution = (first_contribution
+                                  * (math.pow(1 + annual_increase, years_to_retirement) - 1)
+                                  / annual_increase)
+        
+        # Hold the closed form to the detailed projection's int64 paise range
+        # so both modes reject the same inputs
+        if not (abs(epf_balance) < _INT64_MAX / 100
+                and abs(total_contribution) < _INT64_MAX / 100):
+            raise OverflowError('amount too large for paise arithmetic')
+        
+        return {
+            'total_contribution': round(total_contribution, 2),
+            'interest_earned': round(epf_balance - total_contribution, 2),
+            'final_balance': round(epf_balance, 2),
+            'yearly_data': {
+                'year': [],
+                'monthly_salary': [],
+                'annual_contribution': [],
+                'interest_earned': [],
+                'epf_balance': []
+            }
+        }
+    
+    # Quantize to paise and parts per million so equivalent inputs share a cache entry
+    (monthly_salaries, annual_contribution, interest_earned, epf_balances,
+     total_contribution, total_interest) = _projection(
+        paise(monthly_salary),
+        years_to_retirement,
+        parts_per_million(epf_contribution_rate),
+        parts_per_million(annual_increase),
+        parts_per_million(interest_rate)
+    )
+    epf_balance = epf_balances[-1] if years_to_retirement > 0 else 0.0
+    
+    # Store yearly data column-wise, one array per field
+    yearly_data = {
+        'year': np.arange(current_age + 1, current_age + 1 + years_to_retirement),
+        'monthly_salary': monthly_salaries,
+        'annual_contribution': annual_contribution,
+        'interest_earned': interest_earned,
+        'epf_balance': epf_balances
+    }
+    
+    return {
+        'total_contribution': total_contribution,
+        'interest_earned': total_interest,
+        'final_balance': float(epf_balance),
+        'yearly_data': yearly_data
+    }
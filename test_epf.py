@@ -0,0 +1,211 @@
+"""
+Regression tests for the EPF projection (epf_core) and CLI formatting (epf_cli)
+
+Run with: python -m pytest
+"""
+
+import orjson
+import pytest
+
+from app import (CANONICAL_INPUTS, CANONICAL_RESPONSES, MAX_YEARS_TO_RETIREMENT,
+                 _cached_json, _epf_payload, _input_key, _serialize, app)
+from epf_cli import format_currency
+from epf_core import _INT64_MAX, _INT64_MIN, _apply_ppm, _projection, calculate_epf_balance
+
+# Closed form (floating point) and detailed path (whole paise each year)
+# agree to within this relative tolerance
+SUMMARY_TOLERANCE = 1e-5
+
+DEFAULT_REQUEST = {
+    'monthly_salary': 50000,
+    'current_age': 30,
+    'retirement_age': 60,
+    'epf_contribution_rate': 24,
+    'annual_increase': 5,
+    'interest_rate': 8.25,
+}
+
+
+@pytest.fixture
+def client():
+    return app.test_client()
+
+
+def test_default_projection_in_paise():
+    result = calculate_epf_balance()
+    yearly_data = result['yearly_data']
+
+    assert result['final_balance'] == 28638188.47
+    assert result['total_contribution'] == 9567194.72
+    assert result['interest_earned'] == 19070993.75
+    assert yearly_data['year'].tolist()[:3] == [31, 32, 33]
+    assert yearly_data['monthly_salary'].tolist()[:5] == [50000.0, 52500.0, 55125.0, 57881.25, 60775.31]
+    assert yearly_data['annual_contribution'].tolist()[4] == 175032.89
+    assert yearly_data['epf_balance'].tolist()[:3] == [144000.0, 307080.0, 491174.1]
+    assert yearly_data['epf_balance'].tolist()[-1] == result['final_balance']
+
+
+@pytest.mark.parametrize('monthly_salary', [15000, 12345.67, 250000])
+@pytest.mark.parametrize('years', [1, 10, 40])
+@pytest.mark.parametrize('annual_increase, interest_rate', [
+    (0.0, 0.0825),
+    (0.05, 0.0825),
+    (0.0825, 0.0825),
+    (0.08125, 0.081),
+])
+def test_summary_matches_detailed(monthly_salary, years, annual_increase, interest_rate):
+    args = (monthly_salary, 30, 30 + years, 0.24, annual_increase, interest_rate)
+    summary = calculate_epf_balance(*args, detailed=False)
+    detailed = calculate_epf_balance(*args)
+
+    for key in ('final_balance', 'total_contribution', 'interest_earned'):
+        assert summary[key] == pytest.approx(detailed[key], rel=SUMMARY_TOLERANCE, abs=0.05)
+
+
+def test_summary_route(client):
+    summary = client.post('/calculate-epf?summary=1', json=DEFAULT_REQUEST).json
+    detailed = client.post('/calculate-epf', json=DEFAULT_REQUEST).json
+
+    assert summary['success'] is True
+    for key in ('final_amount', 'total_contribution', 'total_interest'):
+        assert summary[key] == pytest.approx(detailed[key], rel=SUMMARY_TOLERANCE)
+    assert all(column == [] for column in summary['yearly_data'].values())
+    assert len(detailed['yearly_data']['year']) == 30
+
+
+@pytest.mark.parametrize('inputs', CANONICAL_INPUTS)
+def test_canonical_response_matches_fresh_body(client, inputs):
+    (monthly_salary, current_age, retirement_age,
+     epf_contribution_rate, annual_increase, interest_rate) = inputs
+    _projection.cache_clear()
+    fresh = _serialize(_epf_payload(calculate_epf_balance(*inputs)))
+
+    response = client.post('/calculate-epf', json={
+        'monthly_salary': monthly_salary,
+        'current_age': current_age,
+        'retirement_age': retirement_age,
+        'epf_contribution_rate': epf_contribution_rate * 100,
+        'annual_increase': annual_increase * 100,
+        'interest_rate': interest_rate * 100,
+    })
+
+    assert CANONICAL_RESPONSES[_input_key(*inputs)] == fresh
+    assert response.data == fresh
+
+
+@pytest.mark.parametrize('query', ['', '?summary=1'])
+def test_response_cache_reuses_body(client, query):
+    payload = {**DEFAULT_REQUEST, 'monthly_salary': 12345.67}
+    _cached_json.cache_clear()
+
+    first = client.post('/calculate-epf' + query, json=payload)
+    second = client.post('/calculate-epf' + query, json=payload)
+
+    assert _cached_json.cache_info().misses == 1
+    assert _cached_json.cache_info().hits == 1
+    assert first.status_code == second.status_code == 200
+    assert first.data == second.data
+    assert 'ETag' not in second.headers
+
+
+def test_horizon_limit(client):
+    at_limit = client.post('/calculate-epf?summary=1', json={
+        **DEFAULT_REQUEST, 'current_age': 0, 'retirement_age': MAX_YEARS_TO_RETIREMENT
+    })
+    past_limit = client.post('/calculate-epf', json={
+        **DEFAULT_REQUEST, 'current_age': 0, 'retirement_age': MAX_YEARS_TO_RETIREMENT + 1
+    })
+
+    assert at_limit.status_code == 200
+    assert past_limit.status_code == 400
+    assert past_limit.json == {
+        'success': False,
+        'error': f'Retirement age must be within {MAX_YEARS_TO_RETIREMENT} years of current age',
+    }
+
+
+def test_stream_route(client):
+    response = client.post('/calculate-epf?stream=1', json=DEFAULT_REQUEST)
+    detailed = client.post('/calculate-epf', json=DEFAULT_REQUEST).json
+
+    assert response.mimetype == 'application/x-ndjson'
+    totals, *rows = [orjson.loads(line) for line in response.data.splitlines()]
+    assert totals == {key: value for key, value in detailed.items() if key != 'yearly_data'}
+    yearly_data = detailed['yearly_data']
+    assert len(rows) == len(yearly_data['year']) == 30
+    for field, column in yearly_data.items():
+        assert [row[field] for row in rows] == column
+
+
+def test_stream_summary_route(client):
+    response = client.post('/calculate-epf?stream=1&summary=1', json=DEFAULT_REQUEST)
+    summary = client.post('/calculate-epf?summary=1', json=DEFAULT_REQUEST).json
+
+    lines = response.data.splitlines()
+    assert len(lines) == 1
+    assert orjson.loads(lines[0]) == {
+        key: value for key, value in summary.items() if key != 'yearly_data'
+    }
+
+
+@pytest.mark.parametrize('args', [
+    # Salary too large for the contribution product
+    (3e12, 0, 20000, 0.24, 0.0, 0.0),
+    # Each year's contribution (~9.1e12 paise) fits, but their running
+    # total leaves int64 after about a million years
+    (7.6e9, 0, 1_100_000, 1.0, 0.0, 0.0),
+    # The product fits, but rounding it to paise would leave int64
+    (32025597350.19, 30, 31, 0.24, 0.0, 0.0),
+])
+def test_overflow_raises(args):
+    with pytest.raises(OverflowError):
+        calculate_epf_balance(*args)
+
+
+@pytest.mark.parametrize('amount, ppm', [
+    (_INT64_MAX, 1),
+    (_INT64_MIN, 1),
+    (1, _INT64_MIN),
+])
+def test_paise_rounding_overflow_raises(amount, ppm):
+    with pytest.raises(OverflowError):
+        _apply_ppm(amount, ppm)
+
+
+@pytest.mark.parametrize('overrides, error', [
+    ({'monthly_salary': 1e20}, 'Monthly salary must be between 0 and 10,000,000'),
+    ({'monthly_salary': -1}, 'Monthly salary must be between 0 and 10,000,000'),
+    ({'monthly_salary': 'nan'}, 'Monthly salary must be between 0 and 10,000,000'),
+    ({'epf_contribution_rate': 150}, 'EPF contribution rate must be between 0% and 100%'),
+    ({'interest_rate': -150}, 'Annual increase and interest rate must be between -100% and 100%'),
+    ({'annual_increase': 'inf'}, 'Annual increase and interest rate must be between -100% and 100%'),
+    # In range, but 100 years of 30% raises outgrow int64 paise
+    ({'monthly_salary': 10_000_000, 'current_age': 0, 'retirement_age': 100,
+      'epf_contribution_rate': 100, 'annual_increase': 30},
+     'Projected amounts are too large to calculate'),
+])
+@pytest.mark.parametrize('query', ['', '?summary=1'])
+def test_invalid_input_rejected(client, overrides, error, query):
+    response = client.post('/calculate-epf' + query, json={**DEFAULT_REQUEST, **overrides})
+
+    assert response.status_code == 400
+    assert response.json == {'success': False, 'error': error}
+
+
+@pytest.mark.parametrize('amount, expected', [
+    (0, '₹0'),
+    (999, '₹999'),
+    (1000, '₹1,000'),
+    (99999, '₹99,999'),
+    (100000, '₹1,00,000'),
+    (9999999, '₹99,99,999'),
+    (10000000, '₹1,00,00,000'),
+    (28638188.47, '₹2,86,38,188.47'),
+    (144000.5, '₹1,44,000.50'),
+    (0.05, '₹0.05'),
+    (99999.999, '₹1,00,000'),
+    (-1500.25, '-₹1,500.25'),
+    (-10000000, '-₹1,00,00,000'),
+])
+def test_format_currency(amount, expected):
+    assert format_currency(amount) == expected